@@ -1,55 +1,116 @@
 import logging
-from typing import List
-from pydantic import BaseModel, Field, field_validator, ValidationError
+from functools import cached_property
+from typing import Dict, List
+from urllib.parse import urlsplit
+from pydantic import (
+    BaseModel, ConfigDict, Field, field_validator, model_validator,
+    ValidationError
+)
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.routing import Route
-from web3 import Web3, exceptions as web3_exceptions
+from web3 import Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_abi.exceptions import DecodingError
+from eth_utils import decode_hex, function_signature_to_4byte_selector
+import aiohttp
+import asyncio
+import orjson
 import yaml
+import hashlib
+import hmac
 import time
 import re
 import os
-from prometheus_client import generate_latest, Gauge
+import random
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, generate_latest, Counter, Gauge
+)
+
+try:
+    # LibYAML bindings are much faster when PyYAML was built with them
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Bounds on how long one slow or failing RPC endpoint can hold a refresh
+RPC_TIMEOUT = aiohttp.ClientTimeout(total=5)
+RPC_ATTEMPTS = 3
+RPC_BACKOFF_SECONDS = 0.2
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 300
+
+INVALID_LABEL_CHARS = frozenset(' "{}')
+ADDRESS_PATTERN = re.compile(r"(0[xX])?[0-9a-fA-F]{40}\Z")
+
+GET_ETH_BALANCE_SELECTOR = function_signature_to_4byte_selector(
+    "getEthBalance(address)"
+)
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+)
+
+
+def validate_prometheus_label(cls, v):
+    if not INVALID_LABEL_CHARS.isdisjoint(v):
+        raise ValueError("name must be Prometheus label compatible")
+    return v
+
+
+def validate_ethereum_address(cls, v):
+    if not ADDRESS_PATTERN.match(v):
+        raise ValueError("Invalid Ethereum address format")
+    # Store the checksummed form so it is never re-normalized later
+    return Web3.to_checksum_address(v)
+
+
 class Network(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     rpc_endpoint: str
+    # Optional chain id the RPC endpoint is expected to serve
+    chain_id: int = None
+    # Optional Multicall3 deployment used to read all balances in one call
+    multicall_address: str = None
 
-    @field_validator("name")
-    def name_compatible_with_prometheus(cls, v):
-        if " " in v or '"' in v or "{" in v or "}" in v:
-            raise ValueError("name must be Prometheus label compatible")
-        return v
+    name_compatible_with_prometheus = field_validator("name")(
+        validate_prometheus_label
+    )
+    multicall_address_is_valid_ethereum = field_validator(
+        "multicall_address"
+    )(validate_ethereum_address)
 
 
 class Address(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     address: str
     name: str
     network: str
     cluster: str = None
 
-    @field_validator("address")
-    def address_is_valid_ethereum(cls, v):
-        try:
-            checksum_address = Web3.to_checksum_address(v)
-            if not Web3.is_address(checksum_address):
-                raise ValueError("address must be a valid Ethereum address")
-            return checksum_address
-        except ValueError:
-            raise ValueError("Invalid Ethereum address format")
+    address_is_valid_ethereum = field_validator("address")(
+        validate_ethereum_address
+    )
 
-    @field_validator("name")
-    def name_compatible_with_prometheus(cls, v):
-        if " " in v or '"' in v or "{" in v or "}" in v:
-            raise ValueError("name must be Prometheus label compatible")
-        return v
+    name_compatible_with_prometheus = field_validator("name")(
+        validate_prometheus_label
+    )
+
+    @cached_property
+    def balance_calldata(self) -> bytes:
+        # Multicall3 getEthBalance call data, encoded once per address
+        return GET_ETH_BALANCE_SELECTOR + abi_encode(
+            ["address"], [self.address]
+        )
 
 
 class Config(BaseModel):
@@ -59,24 +120,51 @@ class Config(BaseModel):
     # Optional static bearer token for authentication
     static_bearer_token: str = None
 
+    @model_validator(mode="after")
+    def addresses_reference_known_networks(self):
+        network_names = {network.name for network in self.networks}
+        for address in self.addresses:
+            if address.network not in network_names:
+                raise ValueError(
+                    f"address {address.name} references unknown network "
+                    f"{address.network}"
+                )
+        return self
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 
 # Middleware class for Bearer token authentication
 class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
+    prefix = "bearer "
+
     def __init__(self, app, token):
         super().__init__(app)
         self.static_token = token
+        self.static_token_bytes = token.encode()
 
     async def dispatch(self, request: Request, call_next):
         authorization: str = request.headers.get("Authorization")
         if not authorization:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Authorization header missing"},
                 status_code=401
             )
 
-        scheme, _, token = authorization.partition(' ')
-        if not scheme or scheme.lower() != "bearer" or token != self.static_token:
-            return JSONResponse(
+        # The scheme is case-insensitive, the token is compared in constant
+        # time to avoid leaking it through response timing
+        prefix_length = len(self.prefix)
+        if (
+            authorization[:prefix_length].lower() != self.prefix
+            or not hmac.compare_digest(
+                authorization[prefix_length:].encode(),
+                self.static_token_bytes
+            )
+        ):
+            return ORJSONResponse(
                 {"error": "Unauthorized"},
                 status_code=401
             )
@@ -85,27 +173,31 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
         return response
 
 
+ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")  # Pattern to match ${VAR_NAME}
+
+
+def replace_env_variable(match: re.Match) -> str:
+    env_var = match.group(1)
+    return os.getenv(env_var, match.group(0))  # Keep as is if not found
+
+
 def substitute_env_variables(config_data: dict) -> dict:
     """
     Recursively search for environment variable placeholders in
     the configuration
-    and replace them with actual environment variable values.
+    and replace them in place with actual environment variable values.
     """
-    pattern = re.compile(r"\$\{(\w+)\}")  # Pattern to match ${VAR_NAME}
-
-    def replace(match):
-        env_var = match.group(1)
-        return os.getenv(env_var, f"${{{env_var}}}")  # Keep as is if not found
-
     def search_replace(obj):
-        if isinstance(obj, dict):
-            return {k: search_replace(v) for k, v in obj.items()}
+        if isinstance(obj, str):
+            if "${" in obj:
+                return ENV_VAR_PATTERN.sub(replace_env_variable, obj)
+        elif isinstance(obj, dict):
+            for k, v in obj.items():
+                obj[k] = search_replace(v)
         elif isinstance(obj, list):
-            return [search_replace(element) for element in obj]
-        elif isinstance(obj, str):
-            return pattern.sub(replace, obj)
-        else:
-            return obj
+            for i, element in enumerate(obj):
+                obj[i] = search_replace(element)
+        return obj
 
     return search_replace(config_data)
 
@@ -117,47 +209,334 @@ def load_config() -> Config:
         raise SystemExit("ETH_BALANCE_CONFIG_PATH environment variable is not set")
 
     try:
-        with open(config_path, "r") as file:
-            config_data = yaml.safe_load(file)
+        # Read the whole file at once and let the parser decode the bytes
+        with open(config_path, "rb") as file:
+            raw_config = file.read()
+        if config_path.endswith(".json"):
+            config_data = orjson.loads(raw_config)
+        else:
+            config_data = yaml.load(raw_config, Loader=YAMLLoader)
         config_data = substitute_env_variables(config_data)
         return Config.model_validate(config_data)
     except FileNotFoundError:
         logger.fatal(f"Config file not found at path: {config_path}")
         raise SystemExit(f"Config file not found at path: {config_path}")
-    except (yaml.YAMLError, ValidationError) as e:
+    except (yaml.YAMLError, orjson.JSONDecodeError, ValidationError) as e:
         logger.fatal(f"Error loading or validating config file: {e}")
         raise SystemExit(e)
 
 
-def update_metrics():
-    timestamp = str(int(time.time()))  # Get current time as a string
-    for network in config.networks:
-        w3 = Web3(Web3.HTTPProvider(network.rpc_endpoint))
-        for address in config.addresses:
-            if address.network == network.name:
-                try:
-                    balance = w3.eth.get_balance(address.address)
-                    balance_gauge.labels(
-                        address=address.address,
-                        address_name=address.name,
-                        network_name=network.name,
-                        cluster=address.cluster
-                    ).set(
-                        balance
-                    )  # Include timestamp
-                except web3_exceptions.Web3Exception as e:
-                    logger.warning(
-                        f"Failed to update balance for {address.address}: {e}"
-                    )
-                logger.info(
-                    f"Updated balance {address.name} as {address.address} on "
-                    f"{network.name} at {timestamp} to {balance} wei"
+def group_addresses_by_network(config: Config) -> Dict[str, List[Address]]:
+    """
+    Group the configured addresses by the name of the network they live on.
+    """
+    by_network: Dict[str, List[Address]] = {
+        network.name: [] for network in config.networks
+    }
+    for address in config.addresses:
+        by_network[address.network].append(address)
+    return by_network
+
+
+async def post_rpc(endpoint: str, payload):
+    async with session.post(
+        endpoint,
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        response.raise_for_status()
+        return await response.json(loads=orjson.loads, content_type=None)
+
+
+def rpc_result(reply) -> str:
+    """
+    Return the hex string result of a JSON-RPC reply, raising ValueError
+    for error replies and anything else that is not a well formed result.
+    """
+    if not isinstance(reply, dict):
+        raise ValueError(f"Unexpected RPC reply: {reply}")
+    result = reply.get("result")
+    if not isinstance(result, str):
+        error = reply.get("error")
+        raise ValueError(error or f"Unexpected RPC reply: {reply}")
+    return result
+
+
+async def fetch_chain_id(endpoint: str) -> int:
+    """
+    Return the chain id served by the endpoint, only asking it once.
+    """
+    if endpoint not in chain_ids:
+        reply = await post_rpc(endpoint, {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "eth_chainId",
+            "params": [],
+        })
+        chain_ids[endpoint] = int(rpc_result(reply), 16)
+    return chain_ids[endpoint]
+
+
+async def fetch_balance(endpoint: str, address: Address):
+    """
+    Fetch the balance of a single address, returning the balance in wei or
+    the error reported for it.
+    """
+    reply = await post_rpc(endpoint, {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "eth_getBalance",
+        "params": [address.address, "latest"],
+    })
+    try:
+        return int(rpc_result(reply), 16)
+    except ValueError as e:
+        return e
+
+
+async def fetch_balances(endpoint: str, addresses: List[Address]) -> list:
+    """
+    Fetch the balances of all addresses with a single JSON-RPC batch request,
+    or with one request per address on endpoints that reject batches.
+    Returns one entry per address, either the balance in wei or the error
+    reported for that address.
+    """
+    if endpoint in batch_unsupported:
+        return await asyncio.gather(
+            *[fetch_balance(endpoint, address) for address in addresses]
+        )
+
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_getBalance",
+            "params": [address.address, "latest"],
+        }
+        for i, address in enumerate(addresses)
+    ]
+    replies = await post_rpc(endpoint, payload)
+    if not isinstance(replies, list):
+        # Some endpoints answer a batch with a single error object, query
+        # them one address at a time from now on
+        logger.warning(
+            f"Batch request rejected by {urlsplit(endpoint).hostname}, "
+            f"falling back to one request per address: {replies}"
+        )
+        batch_unsupported.add(endpoint)
+        return await fetch_balances(endpoint, addresses)
+
+    # Batch replies may arrive in any order, match them back by id
+    results = [ValueError("No response for request")] * len(addresses)
+    for reply in replies:
+        # Skip replies that cannot be matched back to a request, such as
+        # errors reported with a null id
+        reply_id = reply.get("id") if isinstance(reply, dict) else None
+        if type(reply_id) is not int or not 0 <= reply_id < len(addresses):
+            continue
+        try:
+            results[reply_id] = int(rpc_result(reply), 16)
+        except ValueError as e:
+            results[reply_id] = e
+    return results
+
+
+async def fetch_balances_multicall(
+    endpoint: str, multicall_address: str, addresses: List[Address]
+) -> list:
+    """
+    Fetch the balances of all addresses with a single eth_call to
+    Multicall3's aggregate3, calling its getEthBalance helper per address.
+    All balances are read from the same block. Returns the same shape as
+    fetch_balances.
+    """
+    calls = [
+        (
+            multicall_address,
+            True,  # allowFailure
+            address.balance_calldata,
+        )
+        for address in addresses
+    ]
+    data = AGGREGATE3_SELECTOR + abi_encode(
+        ["(address,bool,bytes)[]"], [calls]
+    )
+    call = {"to": multicall_address, "data": "0x" + data.hex()}
+    reply = await post_rpc(endpoint, {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "eth_call",
+        "params": [call, "latest"],
+    })
+    result = rpc_result(reply)
+
+    try:
+        (call_results,) = abi_decode(
+            ["(bool,bytes)[]"], decode_hex(result)
+        )
+        return [
+            abi_decode(["uint256"], return_data)[0] if success
+            else ValueError("getEthBalance call failed")
+            for success, return_data in call_results
+        ]
+    except DecodingError as e:
+        raise ValueError(f"Unexpected aggregate3 response: {e}")
+
+
+class CircuitBreaker:
+    """
+    Track consecutive failures of an RPC endpoint and stop querying it for
+    a while once too many happened in a row.
+    """
+    def __init__(self):
+        self.fail_count = 0
+        self.opened_at = None
+
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= BREAKER_COOLDOWN_SECONDS:
+            # Let the next refresh probe the endpoint again
+            self.opened_at = None
+            return False
+        return True
+
+    def record_success(self):
+        self.fail_count = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.fail_count += 1
+        if self.fail_count >= BREAKER_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+
+
+async def fetch_balances_with_retry(
+    network: Network, addresses: List[Address]
+) -> list:
+    for attempt in range(RPC_ATTEMPTS):
+        try:
+            if network.multicall_address:
+                return await fetch_balances_multicall(
+                    network.rpc_endpoint, network.multicall_address, addresses
                 )
+            return await fetch_balances(network.rpc_endpoint, addresses)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            if attempt == RPC_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(RPC_BACKOFF_SECONDS * 2 ** attempt)
+
+
+async def fetch_network(network: Network):
+    addresses = addresses_by_network[network.name]
+    breaker = breakers[network.rpc_endpoint]
+    if breaker.is_open():
+        logger.warning(
+            f"Skipping {network.name}, its RPC endpoint keeps failing"
+        )
+        update_failure_counter.labels(network_name=network.name).inc(
+            len(addresses)
+        )
+        return
+    try:
+        if network.chain_id is not None:
+            chain_id = await fetch_chain_id(network.rpc_endpoint)
+            if chain_id != network.chain_id:
+                # A config error rather than an endpoint failure, keep it
+                # out of the breaker shared with other networks on the URL
+                logger.error(
+                    f"Skipping {network.name}, its RPC endpoint serves chain "
+                    f"{chain_id} instead of {network.chain_id}"
+                )
+                update_failure_counter.labels(network_name=network.name).inc(
+                    len(addresses)
+                )
+                return
+        balances = await fetch_balances_with_retry(network, addresses)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.warning(
+            f"Failed to update balances on {network.name}: {e}"
+        )
+        update_failure_counter.labels(network_name=network.name).inc(
+            len(addresses)
+        )
+        breaker.record_failure()
+        endpoint_open_gauge.labels(network_name=network.name).set(
+            breaker.is_open()
+        )
+        return
+    breaker.record_success()
+    endpoint_open_gauge.labels(network_name=network.name).set(0)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    updated = 0
+    for address, balance in zip(addresses, balances):
+        if isinstance(balance, Exception):
+            logger.warning(
+                f"Failed to update balance for {address.address}: {balance}"
+            )
+            continue
+        gauge = address_gauges.get(address)
+        if gauge is None:
+            gauge = address_gauges[address] = balance_gauge.labels(
+                address=address.address,
+                address_name=address.name,
+                network_name=network.name,
+                cluster=address.cluster
+            )
+        gauge.set(balance)
+        updated += 1
+        if debug:
+            logger.debug(
+                f"Updated balance {address.name} as {address.address} on "
+                f"{network.name} to {balance} wei"
+            )
+    update_success_counter.labels(network_name=network.name).inc(updated)
+    if updated:
+        last_update_gauge.labels(
+            network_name=network.name
+        ).set_to_current_time()
+    update_failure_counter.labels(network_name=network.name).inc(
+        len(addresses) - updated
+    )
+
+
+async def update_metrics():
+    # Networks are independent, query all of them concurrently and keep an
+    # unexpected error on one of them from aborting the others
+    networks = [
+        network for network in config.networks
+        if addresses_by_network[network.name]
+    ]
+    results = await asyncio.gather(
+        *[fetch_network(network) for network in networks],
+        return_exceptions=True
+    )
+    for network, result in zip(networks, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Unexpected error updating balances on {network.name}",
+                exc_info=result
+            )
+
+
+def render_metrics():
+    global metrics_body, metrics_etag
+    metrics_body = generate_latest()
+    digest = hashlib.blake2b(metrics_body, digest_size=8).hexdigest()
+    metrics_etag = f'"{digest}"'
 
 
 async def metrics(request):
-    metrics_data = generate_latest()
-    return Response(metrics_data, media_type="text/plain")
+    # Serve the body rendered after the last refresh, scrapes never trigger
+    # RPC calls or re-render the registry
+    if metrics_body is None:
+        render_metrics()
+    headers = {"ETag": metrics_etag}
+    if request.headers.get("If-None-Match") == metrics_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        metrics_body, media_type=CONTENT_TYPE_LATEST, headers=headers
+    )
 
 
 try:
@@ -165,12 +544,50 @@ try:
 except SystemExit:
     exit()
 
+addresses_by_network = group_addresses_by_network(config)
+
+# One breaker per endpoint, shared by all networks using it
+breakers: Dict[str, CircuitBreaker] = {
+    network.rpc_endpoint: CircuitBreaker() for network in config.networks
+}
+
+# Chain id reported by each endpoint, fetched once
+chain_ids: Dict[str, int] = {}
+
+# Endpoints that answered a batch request with a single error object
+batch_unsupported = set()
+
+# Metrics body rendered after the last refresh, and its ETag
+metrics_body: bytes = None
+metrics_etag: str = None
+
+# Pooled HTTP session shared by all RPC requests, opened on startup
+session: aiohttp.ClientSession = None
+
+
+def make_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=32,
+        # Reuse connections within a refresh (retries, chain id lookups,
+        # networks sharing a host) but drop them well before the ~60s idle
+        # timeout of common servers, a POST on a socket the server already
+        # closed is not retried by aiohttp
+        keepalive_timeout=15,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=RPC_TIMEOUT)
+
 
 app = Starlette(
     debug=True,
     routes=[Route("/metrics", metrics)]
 )
 
+# Number of uvicorn worker processes serving the app, each one runs its own
+# refresh task as metrics are kept in process memory. Only WEB_CONCURRENCY
+# is visible here, workers started with --workers are not staggered
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
 # Define a global variable to store the task
 task = None
 
@@ -189,28 +606,90 @@ balance_gauge = Gauge(
     ["address", "address_name", "network_name", "cluster"],
 )
 
-if __name__ == "__main__":
-    import uvicorn
-    import asyncio
+update_success_counter = Counter(
+    "ethereum_balance_update_success",
+    "Number of successful balance updates",
+    ["network_name"],
+)
+
+update_failure_counter = Counter(
+    "ethereum_balance_update_failure",
+    "Number of failed balance updates",
+    ["network_name"],
+)
 
-    update_metrics()
+endpoint_open_gauge = Gauge(
+    "ethereum_balance_rpc_endpoint_open",
+    "1 while the network's RPC endpoint is skipped after repeated failures",
+    ["network_name"],
+)
 
-    async def periodic_task():
-        while True:
-            await asyncio.sleep(config.update_interval_seconds)
-            update_metrics()
+# Label sets never change at runtime, bind each address to its child once.
+# Children are only created on the first successful read so an address is
+# never exported with a balance of 0 before it was fetched. Frozen addresses
+# are hashable and carry the full label set, so they key the cache directly
+address_gauges: Dict[Address, Gauge] = {}
 
-    @app.on_event("startup")
-    async def startup_event():
-        global task
-        task = asyncio.create_task(periodic_task())
-        logger.info("Background task started")
 
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        global task
-        task.cancel()
+last_update_gauge = Gauge(
+    "ethereum_balance_last_update_timestamp_seconds",
+    "Unix time of the last successful balance refresh of the network",
+    ["network_name"],
+)
+
+# Export 0 until a network's first successful refresh, so staleness alerts
+# also fire for networks that never succeeded
+for network_name, addresses in addresses_by_network.items():
+    if addresses:
+        last_update_gauge.labels(network_name=network_name).set(0)
+
+
+async def periodic_task():
+    # Pace refreshes against a monotonic deadline so RPC latency does not
+    # add up into drift, skipping deadlines missed by a slow refresh
+    next_deadline = time.monotonic()
+    if workers > 1:
+        # Every worker refreshes on its own, spread them over the interval
+        # so they don't hit the RPC endpoints at the same moment
+        next_deadline += random.uniform(0, config.update_interval_seconds)
+    while True:
+        try:
+            await update_metrics()
+            render_metrics()
+        except Exception:
+            # Keep refreshing, a dead task would serve frozen values forever
+            logger.exception("Balance refresh failed")
+        next_deadline = max(
+            next_deadline + config.update_interval_seconds, time.monotonic()
+        )
+        await asyncio.sleep(next_deadline - time.monotonic())
+
+
+# Registered unconditionally so the refresh also runs when the app is
+# served by an external uvicorn/gunicorn process
+@app.on_event("startup")
+async def startup_event():
+    global task, session
+    session = make_session()
+    task = asyncio.create_task(periodic_task())
+    logger.info("Background task started")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    global task
+    task.cancel()
+    try:
         await task
-        logger.info("Background task stopped")
+    except asyncio.CancelledError:
+        pass
+    await session.close()
+    logger.info("Background task stopped")
+
+
+if __name__ == "__main__":
+    import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools"
+    )